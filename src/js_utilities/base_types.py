@@ -1,10 +1,14 @@
 """A module for defining a Literal type of HTML element tag names.
 
-This module provides a single `Literal` type called `HTML_ELEMENTS`,
+This module provides a `Literal` type called `HTML_ELEMENTS`,
 which represents a list of valid HTML element tag names. The `Literal`
 type is used to ensure that only valid tag names are used as arguments in
 functions that expect an HTML element tag name.
 
+For runtime checks, `HTML_ELEMENTS_SET` holds the same tag names as a frozenset,
+and `HTML_VOID_TAGS` holds the subset of them that are void (self-closing) elements.
+`tag_fragments` returns the interned opening and closing markup for a tag.
+
 Example usage:
     >>> from __future__ import annotations
     >>> from typing import Union
@@ -14,9 +18,17 @@ Example usage:
     ...
     >>> create_element('div', 'Hello, world!')
     {'tag': 'div', 'content': 'Hello, world!'}
+    >>> 'div' in HTML_ELEMENTS_SET
+    True
+    >>> tag_fragments('div')
+    ('<div>', '</div>')
+    >>> tag_fragments('br')
+    ('<br />', None)
 """
+from __future__ import annotations
 
-from typing import Literal
+import sys
+from typing import Final, Literal, get_args
 
 HTML_ELEMENTS = Literal[
     'a',
@@ -27,6 +39,7 @@ HTML_ELEMENTS = Literal[
     'aside',
     'audio',
     'b',
+    'base',
     'bdi',
     'bdo',
     'blockquote',
@@ -74,10 +87,12 @@ HTML_ELEMENTS = Literal[
     'label',
     'legend',
     'li',
+    'link',
     'main',
     'map',
     'mark',
     'menu',
+    'meta',
     'meter',
     'nav',
     'object',
@@ -120,3 +135,54 @@ HTML_ELEMENTS = Literal[
     'video',
     'wbr',
 ]
+
+_HTML_TAG_TUPLE: Final[tuple[str, ...]] = get_args(HTML_ELEMENTS)
+
+HTML_ELEMENTS_SET: Final[frozenset[str]] = frozenset(_HTML_TAG_TUPLE)
+
+HTML_VOID_TAGS: Final[frozenset[str]] = frozenset(
+    {
+        'area',
+        'base',
+        'br',
+        'col',
+        'command',
+        'embed',
+        'hr',
+        'img',
+        'input',
+        'keygen',
+        'link',
+        'meta',
+        'param',
+        'source',
+        'track',
+        'wbr',
+    }
+)
+
+_TAG_FRAGMENTS: Final[dict[str, tuple[str, str | None]]] = {
+    sys.intern(tag): (sys.intern(f'<{tag} />'), None)
+    if tag in HTML_VOID_TAGS
+    else (sys.intern(f'<{tag}>'), sys.intern(f'</{tag}>'))
+    for tag in _HTML_TAG_TUPLE
+}
+
+
+def tag_fragments(tag: str) -> tuple[str, str | None]:
+    """Returns the opening and closing markup for a tag name.
+
+    Fragments for the tags in `HTML_ELEMENTS` are built and interned once at import;
+    any other tag name gets freshly built fragments. Void tags are self-closing,
+    so their opening markup is the whole element and their closing markup is None.
+
+    Args:
+        tag: The tag name.
+
+    Returns:
+        A tuple of the opening and closing markup.
+    """
+    fragments = _TAG_FRAGMENTS.get(tag)
+    if fragments is None:
+        return f'<{tag}>', f'</{tag}>'
+    return fragments
@@ -1,7 +1,8 @@
 """This module provides TypedDict structures that can be converted to React components.
 
 This module defines the _ReactComponent and ReactComponent classes that represent the base structure and
-attributes of a React component, respectively.
+attributes of a React component, respectively. ReactComponentNode is an immutable, attribute-based counterpart
+of ReactComponent used when rendering, and ComponentArena stores a whole component tree as flat parallel lists.
 
 Example:
 
@@ -15,10 +16,19 @@ Example:
                 'type': 'div',
                 'children': [{'type': 'p', 'children': 'Hello, world.' }]
             }
+    >>> from js_utilities.react.base_components import ReactComponentNode
+    >>> node = ReactComponentNode.from_dict(parent_component)
+    >>> node.children[0].type
+    'p'
+    >>> from js_utilities.react.base_components import ComponentArena
+    >>> arena = ComponentArena.from_component(parent_component)
+    >>> arena.types
+    ['div', 'p']
 """
 from __future__ import annotations
 
-from typing import TypedDict
+from collections import deque
+from typing import NamedTuple, TypedDict
 
 from js_utilities.base_types import HTML_ELEMENTS
 
@@ -49,3 +59,160 @@ class ReactComponent(_ReactComponent):
     """
 
     type: HTML_ELEMENTS
+
+
+class ReactComponentNode(NamedTuple):
+    """An immutable representation of a React component.
+
+    Attribute access avoids the per-key lookups of ReactComponent when walking a component tree,
+    and children are held in a tuple.
+
+    Attributes:
+
+        type: The HTML element type of the React component.
+        name: The name of the React component.
+        is_functional: Whether the React component is functional or class-based, or None if unset.
+        children: The children of the React component. It can be a tuple of ReactComponentNode objects,
+                  a string, a boolean, or an integer.
+        props: The props of the React component.
+    """
+
+    type: HTML_ELEMENTS
+    name: str | None = None
+    is_functional: bool | None = None
+    children: tuple[ReactComponentNode, ...] | str | bool | int | None = None
+    props: dict[str, str | bool | int] | None = None
+
+    @classmethod
+    def from_dict(cls, component: ReactComponent) -> ReactComponentNode:
+        """Returns the node for the given ReactComponent, converting its children as well.
+
+        Args:
+            component: The ReactComponent to convert.
+
+        Returns:
+            The equivalent ReactComponentNode.
+        """
+        children = component.get('children')
+        return cls(
+            type=component['type'],
+            name=component.get('name'),
+            is_functional=component.get('is_functional'),
+            children=tuple(cls.from_dict(child) for child in children)
+            if isinstance(children, list)
+            else children,
+            props=component.get('props'),
+        )
+
+    def to_dict(self) -> ReactComponent:
+        """Returns the ReactComponent for this node, converting its children as well.
+
+        Returns:
+            The equivalent ReactComponent. Attributes that are None are left out.
+        """
+        component = ReactComponent(type=self.type)
+        if self.name is not None:
+            component['name'] = self.name
+        if self.is_functional is not None:
+            component['is_functional'] = self.is_functional
+        if isinstance(self.children, tuple):
+            component['children'] = [
+                child.to_dict() for child in self.children
+            ]
+        elif self.children is not None:
+            component['children'] = self.children
+        if self.props is not None:
+            component['props'] = self.props
+        return component
+
+
+class ComponentArena:
+    """A component tree flattened into parallel lists indexed by node id.
+
+    Nodes are numbered breadth-first from the root (id 0), so the children of every node occupy a
+    contiguous id range and a full pass over the tree is a linear scan of the lists.
+
+    Attributes:
+
+        types: The HTML element type of each node.
+        names: The name of each node, or None.
+        is_functional: Whether each node is functional or class-based.
+        props: The props of each node, or None.
+        contents: The string, boolean or integer children of each node, or None if it has none or has
+                  component children.
+        child_ranges: The (start, stop) id range of the component children of each node.
+    """
+
+    __slots__ = (
+        'types',
+        'names',
+        'is_functional',
+        'props',
+        'contents',
+        'child_ranges',
+    )
+
+    def __init__(self) -> None:
+        self.types: list[HTML_ELEMENTS] = []
+        self.names: list[str | None] = []
+        self.is_functional: list[bool] = []
+        self.props: list[dict[str, str | bool | int] | None] = []
+        self.contents: list[str | bool | int | None] = []
+        self.child_ranges: list[tuple[int, int]] = []
+
+    def __len__(self) -> int:
+        return len(self.types)
+
+    @classmethod
+    def from_component(
+        cls, component: ReactComponent | ReactComponentNode
+    ) -> ComponentArena:
+        """Returns the arena for the component tree rooted at the given component.
+
+        Args:
+            component: The root of the component tree, as a ReactComponent or a ReactComponentNode.
+
+        Returns:
+            The flattened component tree.
+        """
+        arena = cls()
+        queue = deque([component])
+        next_id = 1
+        children: list[ReactComponent] | tuple[
+            ReactComponentNode, ...
+        ] | str | bool | int | None
+        while queue:
+            node = queue.popleft()
+            if isinstance(node, ReactComponentNode):
+                arena.types.append(node.type)
+                arena.names.append(node.name)
+                arena.is_functional.append(bool(node.is_functional))
+                arena.props.append(node.props)
+                children = node.children
+            else:
+                arena.types.append(node['type'])
+                arena.names.append(node.get('name'))
+                arena.is_functional.append(node.get('is_functional', False))
+                arena.props.append(node.get('props'))
+                children = node.get('children')
+            if isinstance(children, (list, tuple)):
+                stop = next_id + len(children)
+                arena.contents.append(None)
+                arena.child_ranges.append((next_id, stop))
+                next_id = stop
+                queue.extend(children)
+            else:
+                arena.contents.append(children)
+                arena.child_ranges.append((next_id, next_id))
+        return arena
+
+    def children(self, node_id: int) -> range:
+        """Returns the ids of the component children of the given node.
+
+        Args:
+            node_id: The id of the parent node.
+
+        Returns:
+            A range of child node ids.
+        """
+        return range(*self.child_ranges[node_id])
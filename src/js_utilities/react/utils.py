@@ -14,17 +14,25 @@ Functions:
     react_component(component: ReactComponent) -> str:
         Returns a React component based on the type of the given component.
 """
-from inspect import stack
+from __future__ import annotations
 
-from js_utilities.react.base_components import ReactComponent
+import sys
+from functools import lru_cache
+from typing import Final
+
+from js_utilities.react.base_components import (
+    ReactComponent,
+    ReactComponentNode,
+)
 from js_utilities.vanilla.utils import (
-    add_curls,
     camelize,
     class_component,
     functional_component,
-    return_,
 )
 
+_RENDER_PREFIX: Final[str] = 'render(){return (<'
+_RENDER_SUFFIX: Final[str] = ' />)}'
+
 
 def react_function() -> str:
     """Returns a string representation of a React function call based on the name of the calling function.
@@ -35,7 +43,20 @@ def react_function() -> str:
     Examples:
         If the calling function is `use_state_hook()`, this function will return "React.useStateHook()".
     """
-    action, *hook = stack()[1][3].split('_')
+    return _format_react_call(sys._getframe(1).f_code.co_name)
+
+
+@lru_cache(maxsize=256)
+def _format_react_call(caller_name: str) -> str:
+    """Returns the React function call for the name of the function calling `react_function`.
+
+    Args:
+        caller_name: The name of the calling function, such as 'use_state'.
+
+    Returns:
+        A string representing a React function call.
+    """
+    action, *hook = caller_name.split('_')
     if len(hook) > 1:
         hook = [word.title() for word in hook]
     hook = camelize(''.join(hook))
@@ -55,10 +76,10 @@ def _render_return(components: str) -> str:
     Returns:
         A string representing the render function with the given components.
     """
-    components = f'<{components} />'
-    return f'render(){add_curls(return_(components))}'
+    return _RENDER_PREFIX + components + _RENDER_SUFFIX
 
 
+@lru_cache(maxsize=512)
 def class_declaration(name: str, react_type: str) -> str:
     """Returns a string representing the declaration of a JavaScript class for a given React component.
 
@@ -80,11 +101,12 @@ def class_declaration(name: str, react_type: str) -> str:
     return f'export class {name} extends React.{react_type.title()}'
 
 
-def react_component(component: ReactComponent) -> str:
+def react_component(component: ReactComponent | ReactComponentNode) -> str:
     """Returns a React component based on the type of the given component.
 
     Args:
-        component: The python object rendition of the javascript component to be rendered.
+        component: The python object rendition of the javascript component to be rendered,
+                   either as a ReactComponent or a ReactComponentNode.
 
     Returns:
         The React component as a string.
@@ -96,7 +118,12 @@ def react_component(component: ReactComponent) -> str:
         >>> react_component
         'class RootComponent extends React.Component { ... }'
     """
-    if component.get('is_functional'):
+    if isinstance(component, ReactComponentNode):
+        is_functional = component.is_functional
+    else:
+        is_functional = component.get('is_functional', False)
+
+    if is_functional:
         return functional_component(component)
 
     return class_component(component)
@@ -2,7 +2,8 @@
 
 This module provides two classes, `_HTMLElement` and `HTMLElement`, that represent HTML elements as dictionaries with
 various attributes. The `_HTMLElement` class is a base class that can be used to represent generic HTML elements, while
-the `HTMLElement` class adds a `tag` attribute to represent a specific HTML tag name.
+the `HTMLElement` class adds a `tag` attribute to represent a specific HTML tag name. `HTMLElementNode` is an
+immutable, attribute-based counterpart of `HTMLElement` for walking element trees.
 
 Example usage:
 
@@ -10,11 +11,14 @@ Example usage:
     >>> div = HTMLElement(tag="div", content="Hello, world!", attributes={"class": "my-class"})
     >>> div
     {'tag': 'div', 'content': 'Hello, world!', 'attributes': {'class': 'my-class'}}
+    >>> from js_utilities.vanilla.base_components import HTMLElementNode
+    >>> HTMLElementNode.from_dict(div).tag
+    'div'
 """
 
 from __future__ import annotations
 
-from typing import TypedDict
+from typing import Any, NamedTuple, TypedDict
 
 
 class _HTMLElement(TypedDict, total=False):
@@ -23,11 +27,11 @@ class _HTMLElement(TypedDict, total=False):
     Attributes:
 
         attributes: A dictionary of attribute name-value pairs for the HTML element.
-        content: The content of the HTML element.
+        content: The content of the HTML element, either a string or a list of child HTMLElement objects.
     """
 
-    attributes: dict[str, str | dict]
-    content: str
+    attributes: dict[str, str | dict[str, Any]]
+    content: str | list[HTMLElement]
 
 
 class HTMLElement(_HTMLElement):
@@ -38,3 +42,52 @@ class HTMLElement(_HTMLElement):
     """
 
     tag: str
+
+
+class HTMLElementNode(NamedTuple):
+    """An immutable representation of an HTML element.
+
+    Attributes:
+        tag: The tag name for the HTML element.
+        attributes: A dictionary of attribute name-value pairs for the HTML element, or None.
+        content: The content of the HTML element, either a string or a tuple of child HTMLElementNode objects,
+                 or None if the element has no content.
+    """
+
+    tag: str
+    attributes: dict[str, str | dict[str, Any]] | None = None
+    content: str | tuple[HTMLElementNode, ...] | None = None
+
+    @classmethod
+    def from_dict(cls, element: HTMLElement) -> HTMLElementNode:
+        """Returns the node for the given HTMLElement, converting a list of child elements as well.
+
+        Args:
+            element: The HTMLElement to convert.
+
+        Returns:
+            The equivalent HTMLElementNode.
+        """
+        content = element.get('content')
+        return cls(
+            tag=element['tag'],
+            attributes=element.get('attributes'),
+            content=tuple(cls.from_dict(child) for child in content)
+            if isinstance(content, list)
+            else content,
+        )
+
+    def to_dict(self) -> HTMLElement:
+        """Returns the HTMLElement for this node, converting child nodes as well.
+
+        Returns:
+            The equivalent HTMLElement. Attributes and content that are None are left out.
+        """
+        element = HTMLElement(tag=self.tag)
+        if self.attributes is not None:
+            element['attributes'] = self.attributes
+        if isinstance(self.content, tuple):
+            element['content'] = [child.to_dict() for child in self.content]
+        elif self.content is not None:
+            element['content'] = self.content
+        return element
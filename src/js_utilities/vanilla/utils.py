@@ -14,17 +14,20 @@ Example usage:
     'hello_world'
 
 Todo:
-    Implement functional_component & class_component functions, render method for ReactComponent in generic function.
+    Implement functional_component & class_component functions on top of render_elements.
 """
 from __future__ import annotations
 
+import io
 import json
 import re
-from functools import singledispatch
+from collections import deque
+from functools import lru_cache, singledispatch
 from typing import (
     Any,
     AnyStr,
     Callable,
+    Final,
     Iterable,
     Mapping,
     NoReturn,
@@ -32,7 +35,12 @@ from typing import (
     Pattern,
 )
 
-from js_utilities.react.base_components import ReactComponent
+from js_utilities.base_types import tag_fragments
+from js_utilities.react.base_components import (
+    ComponentArena,
+    ReactComponent,
+    ReactComponentNode,
+)
 
 
 def add_curls(val: str) -> str:
@@ -54,7 +62,7 @@ def add_curls(val: str) -> str:
     return f'{{{val}}}'
 
 
-def add_state(val: Optional[str] = '') -> str:
+def add_state(val: str = '') -> str:
     """Returns a string representing the state variable in a component.
 
     Used alone, this is normally for adding the state value to
@@ -70,10 +78,10 @@ def add_state(val: Optional[str] = '') -> str:
         >>> add_state("count")
         "state.count"
     """
-    return f"state{f'.{val}' if val else val}"
+    return f'state.{val}' if val else 'state'
 
 
-def add_props(val: Optional[str] = '') -> str:
+def add_props(val: str = '') -> str:
     """Returns a string representing the props variable in a javascript component.
 
     Used alone, this is normally for adding the props value to
@@ -89,10 +97,10 @@ def add_props(val: Optional[str] = '') -> str:
         >>> add_props("name")
         "props.name"
     """
-    return f"props{f'.{val}' if val else val}"
+    return f'props.{val}' if val else 'props'
 
 
-def add_this(val: Optional[str] = '') -> str:
+def add_this(val: str = '') -> str:
     """Returns a string representing the `this` keyword in a javascript class component.
 
     Used alone, this is normally for adding the `this` value to
@@ -128,10 +136,10 @@ def add_class_props(val: str) -> str:
         >>> add_class_props("name")
         "this.props.name"
     """
-    return add_this(add_props(val))
+    return f'this.props.{val}' if val else 'this.props'
 
 
-def add_class_state(val: Optional[str] = '') -> str:
+def add_class_state(val: str = '') -> str:
     """Returns a string representing the state variable in a javascript class component.
 
     Used alone, this is normally for adding the `this.state` value to
@@ -147,7 +155,7 @@ def add_class_state(val: Optional[str] = '') -> str:
         >>> add_class_state("count")
         "this.state.count"
     """
-    return add_this(add_state(val))
+    return f'this.state.{val}' if val else 'this.state'
 
 
 def const(const_name: str, value: str) -> str:
@@ -167,6 +175,57 @@ def const(const_name: str, value: str) -> str:
     return f'const {const_name} = {value}'
 
 
+@singledispatch
+def _ternary_value(t_value: Any) -> str:
+    """Generic function for rendering truthy and falsy values.
+
+    See Also:
+        https://peps.python.org/pep-0443/
+
+    Args:
+        t_value: Any string, integer, boolean, null value or Composite type component.
+
+    Returns:
+        Composite type component.
+    """
+    raise ValueError(f'Type of {type(t_value)} is not allowed.')
+
+
+# ReactComponent is a TypedDict, which cannot be dispatched on, so its runtime type is registered instead.
+@_ternary_value.register(dict)
+@_ternary_value.register(ReactComponentNode)
+def _(_: ReactComponent | ReactComponentNode) -> str:
+    raise NotImplementedError
+
+
+@_ternary_value.register(bool)
+def _(t_value: bool) -> str:
+    return 'true' if t_value else 'false'
+
+
+@_ternary_value.register(int)
+def _(t_value: int) -> str:
+    return int.__repr__(t_value)
+
+
+@_ternary_value.register(str)
+def _(t_value: str) -> str:
+    # Plain printable ASCII needs no escaping; anything else goes through json.
+    if (
+        t_value.isascii()
+        and t_value.isprintable()
+        and '"' not in t_value
+        and '\\' not in t_value
+    ):
+        return f'"{t_value}"'
+    return json.dumps(t_value)
+
+
+@_ternary_value.register(type(None))
+def _(_: None) -> str:
+    return 'null'
+
+
 def ternary_expression(
     condition: str,
     truthy: int | str | bool | type(None),
@@ -190,34 +249,8 @@ def ternary_expression(
     Returns:
         A string representing the JavaScript ternary expression for the given condition and values.
     """
-
-    @singledispatch
-    def ternary_value(t_value: Any) -> NoReturn:
-        """Generic function for rendering truthy and falsy values.
-
-        See Also:
-            https://peps.python.org/pep-0443/
-
-        Args:
-            t_value: Any string, integer, boolean, null value or Composite type component.
-
-        Returns:
-            Composite type component.
-        """
-        raise ValueError(f'Type of {type(t_value)} is not allowed.')
-
-    @ternary_value.register(ReactComponent)
-    def _(_: ReactComponent) -> str:
-        raise NotImplementedError
-
-    @ternary_value.register(int)
-    @ternary_value.register(str)
-    @ternary_value.register(bool)
-    def _(t_value: int | str | bool | type(None)) -> str:
-        return json.dumps(t_value)
-
-    truthy = ternary_value(truthy)
-    falsy = ternary_value(falsy)
+    truthy = _ternary_value(truthy)
+    falsy = _ternary_value(falsy)
     return add_curls(f'{condition} ? {truthy} : {falsy}')
 
 
@@ -318,9 +351,7 @@ def _class_constructor(state: str) -> str:
         >>> _class_constructor(component_state)
         "constructor(props) { super(props); this.state = { count: 0 }; }"
     """
-    class_state = add_class_state()
-    internal = f'super(props);{class_state} = {state}'
-    return f'constructor(props){add_curls(internal)}'
+    return f'constructor(props){{super(props);this.state = {state}}}'
 
 
 def return_(components: Optional[str]) -> str:
@@ -345,7 +376,70 @@ def return_(components: Optional[str]) -> str:
     return f'return ({components})'
 
 
-def functional_component(_: ReactComponent) -> NoReturn:
+_JSX_TEXT_ESCAPES: dict[int, str] = str.maketrans(
+    {'&': '&amp;', '<': '&lt;', '>': '&gt;', '{': '&#123;', '}': '&#125;'}
+)
+
+
+def render_elements(root: ReactComponent | ReactComponentNode) -> str:
+    """Returns the JSX markup for a component tree.
+
+    The tree is flattened into a ComponentArena and rendered from its columns with an explicit stack of
+    node ids, writing to a single buffer, so deep trees do not hit the recursion limit and no intermediate
+    strings are built per subtree. Props are written as JSX attributes holding JavaScript literals.
+    String and integer children are written as text, with `&`, `<`, `>`, `{` and `}` escaped as HTML
+    entities; boolean children are not rendered, as in React. Void tags such as `br` are self-closing
+    and their children are ignored.
+
+    Args:
+        root: The root of the component tree, as a ReactComponent or a ReactComponentNode.
+
+    Raises:
+        ValueError: If a prop value cannot be written as a JavaScript literal.
+
+    Examples:
+        >>> child = ReactComponent(type='p', children='1 < 2', props={'id': 'intro'})
+        >>> render_elements(ReactComponent(type='div', children=[child]))
+        '<div><p id={"intro"}>1 &lt; 2</p></div>'
+
+    Returns:
+        The JSX markup as a string.
+    """
+    arena = ComponentArena.from_component(root)
+    buffer = io.StringIO()
+    # Items are either ids of nodes still to be opened or the closing markup of an open node.
+    stack: list[int | str] = [0]
+    while stack:
+        item = stack.pop()
+        if isinstance(item, str):
+            buffer.write(item)
+            continue
+
+        tag = arena.types[item]
+        open_tag, close_tag = tag_fragments(tag)
+        props = arena.props[item]
+        if props:
+            attributes = ''.join(
+                [
+                    f' {name}={{{_ternary_value(value)}}}'
+                    for name, value in props.items()
+                ]
+            )
+            end = '>' if close_tag is not None else ' />'
+            open_tag = f'<{tag}{attributes}{end}'
+        buffer.write(open_tag)
+        if close_tag is None:
+            continue
+
+        stack.append(close_tag)
+        stack.extend(reversed(arena.children(item)))
+        content = arena.contents[item]
+        if content is not None and not isinstance(content, bool):
+            buffer.write(str(content).translate(_JSX_TEXT_ESCAPES))
+    return buffer.getvalue()
+
+
+def functional_component(_: ReactComponent | ReactComponentNode) -> NoReturn:
     """
 
     Args:
@@ -354,7 +448,7 @@ def functional_component(_: ReactComponent) -> NoReturn:
     raise NotImplementedError
 
 
-def class_component(_: ReactComponent) -> NoReturn:
+def class_component(_: ReactComponent | ReactComponentNode) -> NoReturn:
     """
 
     Args:
@@ -369,6 +463,19 @@ SPLIT_RE: Pattern[AnyStr] = re.compile(
     r'([\-_\s]*[A-Z]+?[^A-Z\-_\s]*[\-_\s]*)'
 )
 UNDERSCORE_RE: Pattern[AnyStr] = re.compile(r'(?<=[^\-_\s])[\-_\s]+[^\-_\s]')
+_ASCII_LOWER: Final[bytes] = bytes.maketrans(
+    b'ABCDEFGHIJKLMNOPQRSTUVWXYZ', b'abcdefghijklmnopqrstuvwxyz'
+)
+
+
+def _upper_last_char(match: re.Match[str]) -> str:
+    """Substitution callback for `UNDERSCORE_RE`, dropping the separators and upper-casing the next character."""
+    return match.group(0)[-1].upper()
+
+
+def _title_match(match: re.Match[str]) -> str:
+    """Substitution callback for `ACRONYM_RE`, title-casing an upper-case run."""
+    return match.group(0).title()
 
 
 def camelize(str_or_iter: list | dict | str) -> list | dict | str:
@@ -382,15 +489,31 @@ def camelize(str_or_iter: list | dict | str) -> list | dict | str:
     """
     if isinstance(str_or_iter, (list, Mapping)):
         return _process_keys(str_or_iter, camelize)
+    if isinstance(str_or_iter, str):
+        return _camelize_str(str_or_iter)
 
     s = str(str_or_iter if str_or_iter else '')
     if s.isupper() or s.isnumeric():
         return str_or_iter
+    return _camelize_str(s)
 
-    if len(s) != 0 and not s[:2].isupper():
-        s = s[0].lower() + s[1:]
 
-    return UNDERSCORE_RE.sub(lambda m: m.group(0)[-1].upper(), s)
+def camelize_many(keys: Iterable[str]) -> list[str]:
+    """Convert many strings from snake_case to camelCase in one call.
+
+    Unlike `camelize`, this skips the per-item type dispatch, so every item must be a string.
+
+    Args:
+        keys: The strings to be converted, such as the keys of a props dictionary.
+
+    Returns:
+        A list of the strings in camelCase format, in the same order.
+
+    Example:
+        >>> camelize_many(["hello_world", "foo_bar"])
+        ['helloWorld', 'fooBar']
+    """
+    return list(map(_camelize_str, keys))
 
 
 def decamelize(str_or_iter: list | dict | str) -> list | dict | str:
@@ -404,26 +527,168 @@ def decamelize(str_or_iter: list | dict | str) -> list | dict | str:
     """
     if isinstance(str_or_iter, (list, Mapping)):
         return _process_keys(str_or_iter, decamelize)
+    if isinstance(str_or_iter, str):
+        return _decamelize_str(str_or_iter)
 
     s = str(str_or_iter if str_or_iter else '')
     if s.isupper() or s.isnumeric():
         return str_or_iter
-    fixed_abbr = ACRONYM_RE.sub(lambda m: m.group(0).title(), s)
+    return _decamelize_str(s)
+
+
+@lru_cache(maxsize=4096)
+def _camelize_str(s: str) -> str:
+    """Cached string conversion behind `camelize`.
+
+    Args:
+        s: The input string.
+
+    Returns:
+        The string in camelCase format.
+    """
+    if s.isupper() or s.isnumeric():
+        return s
+
+    if len(s) != 0 and not s[:2].isupper():
+        s = s[0].lower() + s[1:]
+
+    # Alphanumeric strings have no separators, so there is nothing to substitute.
+    if s.isalnum():
+        return s
+    # Identifiers can only be separated by underscores; unless a part is empty (leading, trailing or
+    # repeated underscores), every underscore is dropped and the character after it upper-cased.
+    if s.isidentifier():
+        first, *rest = s.split('_')
+        if first and all(rest):
+            return first + ''.join(
+                [part[0].upper() + part[1:] for part in rest]
+            )
+    return UNDERSCORE_RE.sub(_upper_last_char, s)
+
+
+@lru_cache(maxsize=4096)
+def _decamelize_str(s: str) -> str:
+    """Cached string conversion behind `decamelize`.
+
+    Args:
+        s: The input string.
+
+    Returns:
+        The string in snake_case format.
+    """
+    if s.isupper() or s.isnumeric():
+        return s
+    if s.isascii() and s.isalnum():
+        return _decamelize_ascii(s)
+    fixed_abbr = ACRONYM_RE.sub(_title_match, s)
     return '_'.join(s for s in SPLIT_RE.split(fixed_abbr) if s).lower()
 
 
+def _decamelize_ascii(s: str) -> str:
+    """Single-pass `decamelize` for ASCII alphanumeric strings.
+
+    Produces the same output as the `ACRONYM_RE`/`SPLIT_RE` path: an underscore goes before each upper-case run
+    that does not start the string, and before the last letter of a run that is followed by a lower-case letter,
+    e.g. "getHTTPResponse" -> "get_http_response".
+
+    Args:
+        s: An ASCII alphanumeric string.
+
+    Returns:
+        The string in snake_case format.
+    """
+    data = s.encode('ascii')
+    out = bytearray()
+    n = len(data)
+    i = 0
+    while i < n:
+        if not 65 <= data[i] <= 90:
+            out.append(data[i])
+            i += 1
+            continue
+
+        j = i + 1
+        while j < n and 65 <= data[j] <= 90:
+            j += 1
+        if i:
+            out.append(95)
+        if j - i > 1 and j < n and not 48 <= data[j] <= 57:
+            out += data[i : j - 1]
+            out.append(95)
+            out.append(data[j - 1])
+        else:
+            out += data[i:j]
+        i = j
+    return out.translate(_ASCII_LOWER).decode('ascii')
+
+
 def _process_keys(str_or_iter: str | Iterable, fn: Callable) -> str | Iterable:
     """A helper function for camelize and decamelize functions.
 
+    Nested lists and mappings are walked with an explicit worklist rather than
+    recursion, so deeply nested input does not hit the recursion limit.
+
     Args:
         str_or_iter: The input string or collection of strings to be processed.
         fn: The conversion function to apply to the input.
 
+    Raises:
+        ValueError: If a list or mapping contains itself.
+
     Returns:
         The output.
     """
-    if isinstance(str_or_iter, list):
-        return [_process_keys(k, fn) for k in str_or_iter]
-    if isinstance(str_or_iter, Mapping):
-        return {fn(k): _process_keys(v, fn) for k, v in str_or_iter.items()}
-    return str_or_iter
+    root = _empty_like(str_or_iter)
+    if root is None:
+        return str_or_iter
+
+    # The worklist is processed depth-first; a None output marks the end of a
+    # container's subtree, so `active` holds the ids of the current ancestors.
+    active: set[int] = set()
+    worklist: deque[tuple[Any, Any]] = deque([(root, str_or_iter)])
+    while worklist:
+        out, src = worklist.pop()
+        if out is None:
+            active.discard(src)
+            continue
+        if id(src) in active:
+            raise ValueError(
+                'Cannot process a collection that contains itself.'
+            )
+
+        active.add(id(src))
+        worklist.append((None, id(src)))
+        items: Iterable[tuple[Any, Any]]
+        if type(out) is list:
+            items = enumerate(src)
+        else:
+            items = ((fn(k), v) for k, v in src.items())
+        for key, value in items:
+            child = _empty_like(value)
+            if child is None:
+                out[key] = value
+            else:
+                out[key] = child
+                worklist.append((child, value))
+    return root
+
+
+def _empty_like(value: Any) -> list[Any] | dict[Any, Any] | None:
+    """Returns an empty output container for a list or mapping, otherwise None.
+
+    Args:
+        value: Any value found while walking the input of `_process_keys`.
+
+    Returns:
+        A list of placeholders the same length as a list value, an empty dict for a mapping, or None for leaves.
+    """
+    value_type = type(value)
+    if value_type is list:
+        return [None] * len(value)
+    if value_type is dict:
+        return {}
+    if isinstance(value, list):
+        return [None] * len(value)
+    if isinstance(value, Mapping):
+        return {}
+    return None
@@ -0,0 +1,26 @@
+import unittest
+
+from js_utilities.base_types import (
+    HTML_ELEMENTS_SET,
+    HTML_VOID_TAGS,
+    tag_fragments,
+)
+
+
+class TestBaseTypes(unittest.TestCase):
+    def test_html_element_sets(self) -> None:
+        self.assertIn('div', HTML_ELEMENTS_SET)
+        self.assertNotIn('MyComponent', HTML_ELEMENTS_SET)
+        self.assertLessEqual(HTML_VOID_TAGS, HTML_ELEMENTS_SET)
+        self.assertIn('meta', HTML_VOID_TAGS)
+        self.assertNotIn('div', HTML_VOID_TAGS)
+
+    def test_tag_fragments(self) -> None:
+        self.assertEqual(tag_fragments('div'), ('<div>', '</div>'))
+        self.assertEqual(tag_fragments('MyTag'), ('<MyTag>', '</MyTag>'))
+        for tag in HTML_VOID_TAGS:
+            self.assertEqual(tag_fragments(tag), (f'<{tag} />', None))
+
+
+if __name__ == '__main__':
+    unittest.main()
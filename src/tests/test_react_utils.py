@@ -1,6 +1,10 @@
 import unittest
 
-from js_utilities.react.base_components import ReactComponent
+from js_utilities.react.base_components import (
+    ComponentArena,
+    ReactComponent,
+    ReactComponentNode,
+)
 from js_utilities.react.utils import (
     _render_return,
     class_declaration,
@@ -59,6 +63,43 @@ class TestUtils(unittest.TestCase):
         home = ReactComponent(name='Home', props={'count': 0}, type='div')
         self.assertRaises(NotImplementedError, react_component, home)
 
+        # Test with a ReactComponentNode
+        node = ReactComponentNode.from_dict(home)
+        self.assertRaises(NotImplementedError, react_component, node)
+
+    def test_react_component_node(self) -> None:
+        child = ReactComponent(type='p', children='Hello, world.')
+        parent = ReactComponent(name='App', type='div', children=[child])
+        node = ReactComponentNode.from_dict(parent)
+
+        self.assertEqual(
+            node.children,
+            (ReactComponentNode(type='p', children='Hello, world.'),),
+        )
+        self.assertEqual(node.to_dict(), parent)
+
+        class_based = ReactComponent(type='div', is_functional=False)
+        self.assertEqual(
+            ReactComponentNode.from_dict(class_based).to_dict(), class_based
+        )
+
+    def test_component_arena(self) -> None:
+        bold = ReactComponent(type='b', children='Hello')
+        paragraph = ReactComponent(type='p', children=[bold])
+        span = ReactComponent(type='span', children=1)
+        app = ReactComponent(
+            name='App', type='div', children=[paragraph, span]
+        )
+
+        for root in (app, ReactComponentNode.from_dict(app)):
+            arena = ComponentArena.from_component(root)
+            self.assertEqual(len(arena), 4)
+            self.assertEqual(arena.types, ['div', 'p', 'span', 'b'])
+            self.assertEqual(arena.contents, [None, None, 1, 'Hello'])
+            self.assertEqual(list(arena.children(0)), [1, 2])
+            self.assertEqual(list(arena.children(1)), [3])
+            self.assertEqual(list(arena.children(2)), [])
+
 
 if __name__ == '__main__':
     unittest.main()
@@ -1,5 +1,7 @@
 import unittest
 
+from js_utilities.react.base_components import ReactComponent
+from js_utilities.vanilla.base_components import HTMLElement, HTMLElementNode
 from js_utilities.vanilla.utils import (
     add_class_props,
     add_class_state,
@@ -8,8 +10,10 @@ from js_utilities.vanilla.utils import (
     add_state,
     add_this,
     camelize,
+    camelize_many,
     const,
     decamelize,
+    render_elements,
     ternary_expression,
 )
 
@@ -21,6 +25,25 @@ class TestJsUtilities(unittest.TestCase):
             camelize('hello_world_hello_world'), 'helloWorldHelloWorld'
         )
         self.assertEqual(camelize('HelloWorld'), 'helloWorld')
+        self.assertEqual(
+            camelize({'hello_world': [{'foo_bar': 'baz_qux'}]}),
+            {'helloWorld': [{'fooBar': 'baz_qux'}]},
+        )
+
+        shared = {'foo_bar': 1}
+        self.assertEqual(
+            camelize([shared, shared]), [{'fooBar': 1}, {'fooBar': 1}]
+        )
+        cyclic: dict[str, list[object]] = {}
+        cyclic['hello_world'] = [cyclic]
+        self.assertRaises(ValueError, camelize, cyclic)
+
+    def test_camelize_many(self) -> None:
+        self.assertEqual(
+            camelize_many(['hello_world', 'HelloWorld', 'HELLO']),
+            ['helloWorld', 'helloWorld', 'HELLO'],
+        )
+        self.assertEqual(camelize_many({'foo_bar': 1}), ['fooBar'])
 
     def test_decamelize(self) -> None:
         self.assertEqual(decamelize('helloWorld'), 'hello_world')
@@ -28,6 +51,12 @@ class TestJsUtilities(unittest.TestCase):
             decamelize('helloWorldHelloWorld'), 'hello_world_hello_world'
         )
         self.assertEqual(decamelize('HelloWorld'), 'hello_world')
+        self.assertEqual(decamelize('getHTTPResponse'), 'get_http_response')
+        self.assertEqual(decamelize('helloWorld2'), 'hello_world2')
+        self.assertEqual(
+            decamelize({'helloWorld': [{'fooBar': 'bazQux'}]}),
+            {'hello_world': [{'foo_bar': 'bazQux'}]},
+        )
 
     def test_add_curls(self) -> None:
         self.assertEqual(add_curls('foo'), '{foo}')
@@ -73,6 +102,79 @@ class TestJsUtilities(unittest.TestCase):
             ternary_expression('x is not None', True, False),
             '{x is not None ? true : false}',
         )
+        self.assertEqual(
+            ternary_expression('x', 'say "hi"', None),
+            '{x ? "say \\"hi\\"" : null}',
+        )
+        self.assertRaises(ValueError, ternary_expression, 'x', 1.5, 0)
+        self.assertRaises(
+            NotImplementedError,
+            ternary_expression,
+            'x',
+            ReactComponent(type='div'),
+            None,
+        )
+
+    def test_render_elements(self) -> None:
+        self.assertEqual(
+            render_elements(ReactComponent(type='div')), '<div></div>'
+        )
+        paragraph = ReactComponent(type='p', children='Hello, world.')
+        span = ReactComponent(type='span', children=1)
+        self.assertEqual(
+            render_elements(
+                ReactComponent(type='div', children=[paragraph, span])
+            ),
+            '<div><p>Hello, world.</p><span>1</span></div>',
+        )
+        self.assertEqual(
+            render_elements(
+                ReactComponent(
+                    type='a',
+                    props={'href': '/', 'hidden': True},
+                    children='Home',
+                )
+            ),
+            '<a href={"/"} hidden={true}>Home</a>',
+        )
+        self.assertEqual(
+            render_elements(ReactComponent(type='p', children='{a} < b')),
+            '<p>&#123;a&#125; &lt; b</p>',
+        )
+        self.assertEqual(
+            render_elements(
+                ReactComponent(type='p', children=[ReactComponent(type='br')])
+            ),
+            '<p><br /></p>',
+        )
+        self.assertEqual(
+            render_elements(
+                ReactComponent(type='img', props={'src': 'a.png', 'width': 10})
+            ),
+            '<img src={"a.png"} width={10} />',
+        )
+
+    def test_html_element_node(self) -> None:
+        div = HTMLElement(
+            tag='div', content='Hello', attributes={'class': 'my-class'}
+        )
+        node = HTMLElementNode.from_dict(div)
+        self.assertEqual(node.tag, 'div')
+        self.assertEqual(node.attributes, {'class': 'my-class'})
+        self.assertEqual(node.content, 'Hello')
+        self.assertEqual(node.to_dict(), div)
+        self.assertEqual(
+            HTMLElementNode.from_dict(HTMLElement(tag='br')).to_dict(),
+            {'tag': 'br'},
+        )
+        empty = HTMLElement(tag='p', content='')
+        self.assertEqual(HTMLElementNode.from_dict(empty).to_dict(), empty)
+        parent = HTMLElement(tag='div', content=[empty])
+        self.assertEqual(
+            HTMLElementNode.from_dict(parent).content,
+            (HTMLElementNode(tag='p', content=''),),
+        )
+        self.assertEqual(HTMLElementNode.from_dict(parent).to_dict(), parent)
 
 
 if __name__ == '__main__':